@@ -415,6 +415,14 @@ void MultiCorePE::handleExternalSpikeEvent(SST::Event* ev) {
     // printf("DEBUG: MultiCorePE::handleExternalSpikeEvent被调用，事件指针: %p, 节点ID: %d\n", (void*)ev, node_id_);
     fflush(stdout);
     
+    // burst事件：展开位图后逐神经元走原有处理路径
+    SpikeBurstEvent* burst = dynamic_cast<SpikeBurstEvent*>(ev);
+    if (burst) {
+        unpackSpikeBurst(burst);
+        delete burst;
+        return;
+    }
+
     SpikeEvent* spike = dynamic_cast<SpikeEvent*>(ev);
     if (!spike) {
         output_->verbose(CALL_INFO, 1, 0, "⚠️ 接收到非SpikeEvent事件\n");
@@ -494,6 +502,26 @@ void MultiCorePE::handleExternalSpikeEvent(SST::Event* ev) {
     }
 }
 
+void MultiCorePE::unpackSpikeBurst(SpikeBurstEvent* burst) {
+    // 逐位展开位图，为每个发放神经元合成单脉冲事件并复用原有路由逻辑
+    // （目标节点ID按与SpikeSource一致的neuron_id/每PE神经元数映射计算）
+    uint32_t neurons_per_pe = static_cast<uint32_t>(num_cores_) * static_cast<uint32_t>(neurons_per_core_);
+    const uint64_t bitmaps[2] = { burst->bitmap_lo, burst->bitmap_hi };
+
+    for (int word = 0; word < 2; ++word) {
+        uint64_t bits = bitmaps[word];
+        while (bits) {
+            uint32_t bit = static_cast<uint32_t>(__builtin_ctzll(bits));
+            bits &= bits - 1;  // 清除最低置位
+
+            uint32_t neuron_id = burst->base_neuron + static_cast<uint32_t>(word) * 64 + bit;
+            uint32_t dest_node = (neurons_per_pe > 0) ? neuron_id / neurons_per_pe : 0;
+            SpikeEvent* spike = new SpikeEvent(neuron_id, neuron_id, dest_node, 1.0, burst->time_us);
+            handleExternalSpikeEvent(spike);
+        }
+    }
+}
+
 void MultiCorePE::handleExternalSpike(SpikeEvent* spike) {
     if (!spike) return;
     
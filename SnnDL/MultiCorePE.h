@@ -121,7 +121,7 @@ public:
 
     // 端口文档 
     SST_ELI_DOCUMENT_PORTS(
-        {"external_spike_input",  "外部脉冲输入端口", {"SnnDL.SpikeEvent"}},
+        {"external_spike_input",  "外部脉冲输入端口", {"SnnDL.SpikeEvent", "SnnDL.SpikeBurstEvent"}},
         {"external_spike_output", "外部脉冲输出端口", {"SnnDL.SpikeEvent"}},
         {"network", "网络连接端口（用于direct_link模式）", {"SnnDL.SpikeEvent", "SimpleNetwork"}},
         {"north", "北向网络连接端口（网格拓扑）", {"SnnDL.SpikeEvent"}},
@@ -330,6 +330,11 @@ private:
      * @brief 处理外部脉冲事件（从Link接收）
      */
     void handleExternalSpikeEvent(SST::Event* ev);
+
+    /**
+     * @brief 展开SpikeBurstEvent位图，逐神经元走原有脉冲处理路径
+     */
+    void unpackSpikeBurst(SpikeBurstEvent* burst);
     
     /**
      * @brief 从SpikeEventWrapper中提取SpikeEvent数据
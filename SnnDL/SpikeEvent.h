@@ -109,6 +109,78 @@ private:
     ImplementSerializable(SST::SnnDL::SpikeEvent)
 };
 
+/**
+ * @brief 脉冲burst事件，承载同一微秒窗口内发放的一组脉冲
+ *
+ * 用两个64位位图表示以base_neuron起始的128个神经元窗口内的发放集合，
+ * 一个事件最多代替128个单脉冲事件，显著降低链路/路由器的事件数。
+ * 窗口外或重复的脉冲由发送方退化为单个SpikeEvent发送。
+ */
+class SpikeBurstEvent : public SST::Event {
+public:
+    /** 脉冲发放的时间戳（微秒） */
+    uint64_t time_us;
+
+    /** 位图覆盖窗口的起始神经元ID */
+    uint32_t base_neuron;
+
+    /** 神经元[base, base+64)的发放位图 */
+    uint64_t bitmap_lo;
+
+    /** 神经元[base+64, base+128)的发放位图 */
+    uint64_t bitmap_hi;
+
+    /** 位图窗口覆盖的神经元数 */
+    static constexpr uint32_t WINDOW_NEURONS = 128;
+
+    /**
+     * @brief 默认构造函数（用于序列化）
+     */
+    SpikeBurstEvent() : SST::Event(), time_us(0), base_neuron(0),
+                        bitmap_lo(0), bitmap_hi(0) {}
+
+    /**
+     * @brief 基本构造函数
+     * @param ts 时间戳（微秒）
+     * @param base 位图窗口的起始神经元ID
+     */
+    SpikeBurstEvent(uint64_t ts, uint32_t base) :
+        SST::Event(), time_us(ts), base_neuron(base),
+        bitmap_lo(0), bitmap_hi(0) {}
+
+    /**
+     * @brief 尝试把一个神经元置入位图
+     * @param neuron_id 发放脉冲的神经元ID
+     * @return 超出窗口或该位已置位时返回false（调用方应退化为单脉冲事件）
+     */
+    bool setNeuron(uint32_t neuron_id) {
+        if (neuron_id < base_neuron) return false;
+        uint32_t offset = neuron_id - base_neuron;
+        if (offset >= WINDOW_NEURONS) return false;
+        uint64_t& word = (offset < 64) ? bitmap_lo : bitmap_hi;
+        uint64_t mask = 1ULL << (offset & 63);
+        if (word & mask) return false;
+        word |= mask;
+        return true;
+    }
+
+    /**
+     * @brief 序列化函数，支持并行仿真中的事件传递
+     * @param ser 序列化器对象
+     */
+    void serialize_order(SST::Core::Serialization::serializer &ser) override {
+        Event::serialize_order(ser);  // 先序列化基类
+        SST_SER(time_us);
+        SST_SER(base_neuron);
+        SST_SER(bitmap_lo);
+        SST_SER(bitmap_hi);
+    }
+
+private:
+    // 注册序列化支持
+    ImplementSerializable(SST::SnnDL::SpikeBurstEvent)
+};
+
 } // namespace SnnDL
 } // namespace SST
 
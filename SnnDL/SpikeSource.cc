@@ -12,6 +12,12 @@
 #include <sstream>
 #include <iostream>
 #include <algorithm>
+#include <cstring>
+
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
 
 using namespace SST;
 using namespace SST::SnnDL;
@@ -32,10 +38,12 @@ SpikeSource::SpikeSource(ComponentId_t id, Params& params) : Component(id) {
     }
 
     dataset_format = params.find<std::string>("dataset_format", "TEXT");
+    dataset_offset = params.find<uint64_t>("dataset_offset", 0);
     time_scale = params.find<float>("time_scale", 1.0f);
     neuron_offset = params.find<uint32_t>("neuron_offset", 0);
     max_events = params.find<uint32_t>("max_events", 0);
     neurons_per_core = params.find<uint32_t>("neurons_per_core", 4);  // 添加neurons_per_core参数
+    burst_pack = params.find<int>("burst_pack", 0) != 0;
     
     // output->verbose(CALL_INFO, 2, 0,
     //     "数据集参数: path=%s, format=%s, time_scale=%.3f, offset=%u, max_events=%u, neurons_per_core=%u\n",
@@ -130,33 +138,22 @@ bool SpikeSource::clockTick(Cycle_t current_cycle) {
     }
     
     // 发送所有到期的脉冲事件
-    while (!spike_queue.empty() && spike_queue.top().timestamp <= current_sim_time) {
-        const SpikeData& spike_data = spike_queue.top();
-        
-        // 创建并发送脉冲事件 - 自动计算目标节点ID  
-        // ★ 修正：每个PE有16个神经元，需要除以16而不是4
-        uint32_t neurons_per_pe = neurons_per_core * 4;  // 4 cores per PE × 4 neurons per core = 16 neurons per PE
-        uint32_t dest_node_id = spike_data.neuron_id / neurons_per_pe;
-        SpikeEvent* spike_event = new SpikeEvent(spike_data.neuron_id, spike_data.neuron_id, dest_node_id, 1.0, spike_data.timestamp);
-        
-        // 检查链接是否有效
-        if (spike_output_link) {
-            // printf("DEBUG: 尝试发送脉冲事件 - 神经元: %u, 时间戳: %lu, Link指针: %p\n", 
-            //        spike_data.neuron_id, spike_data.timestamp, (void*)spike_output_link);
-            // fflush(stdout);
-            
-            spike_output_link->send(spike_event);
-            events_sent_count++;
-            
-            output->verbose(CALL_INFO, 4, 0, "发送脉冲: 神经元%u, 时间%" PRIu64 "\n",
-                           spike_data.neuron_id, spike_data.timestamp);
-        } else {
-            output->verbose(CALL_INFO, 2, 0, "警告: 脉冲输出链接为空，丢弃事件: 神经元%u, 时间%" PRIu64 "\n",
-                           spike_data.neuron_id, spike_data.timestamp);
-            delete spike_event;  // 清理事件内存
+    if (burst_pack) {
+        // 把同一微秒内到期的脉冲打包为一个burst事件，事件数最多降为1/128
+        while (!spike_queue.empty() && spike_queue.top().timestamp <= current_sim_time) {
+            uint64_t burst_ts = spike_queue.top().timestamp;
+            burst_group.clear();
+            while (!spike_queue.empty() && spike_queue.top().timestamp == burst_ts) {
+                burst_group.push_back(spike_queue.top());
+                spike_queue.pop();
+            }
+            sendSpikeBurst(burst_ts, burst_group);
+        }
+    } else {
+        while (!spike_queue.empty() && spike_queue.top().timestamp <= current_sim_time) {
+            sendSpikeData(spike_queue.top());
+            spike_queue.pop();
         }
-        
-        spike_queue.pop();
     }
     
     // 检查是否完成发送
@@ -169,12 +166,75 @@ bool SpikeSource::clockTick(Cycle_t current_cycle) {
 }
 
 // ===== 私有辅助方法 =====
+void SpikeSource::sendSpikeData(const SpikeData& spike_data) {
+    // 创建并发送脉冲事件 - 自动计算目标节点ID
+    // ★ 修正：每个PE有16个神经元，需要除以16而不是4
+    uint32_t neurons_per_pe = neurons_per_core * 4;  // 4 cores per PE × 4 neurons per core = 16 neurons per PE
+    uint32_t dest_node_id = spike_data.neuron_id / neurons_per_pe;
+    SpikeEvent* spike_event = new SpikeEvent(spike_data.neuron_id, spike_data.neuron_id, dest_node_id, 1.0, spike_data.timestamp);
+
+    // 检查链接是否有效
+    if (spike_output_link) {
+        // printf("DEBUG: 尝试发送脉冲事件 - 神经元: %u, 时间戳: %lu, Link指针: %p\n",
+        //        spike_data.neuron_id, spike_data.timestamp, (void*)spike_output_link);
+        // fflush(stdout);
+
+        spike_output_link->send(spike_event);
+        events_sent_count++;
+
+        output->verbose(CALL_INFO, 4, 0, "发送脉冲: 神经元%u, 时间%" PRIu64 "\n",
+                       spike_data.neuron_id, spike_data.timestamp);
+    } else {
+        output->verbose(CALL_INFO, 2, 0, "警告: 脉冲输出链接为空，丢弃事件: 神经元%u, 时间%" PRIu64 "\n",
+                       spike_data.neuron_id, spike_data.timestamp);
+        delete spike_event;  // 清理事件内存
+    }
+}
+
+void SpikeSource::sendSpikeBurst(uint64_t burst_ts, const std::vector<SpikeData>& group) {
+    if (!spike_output_link) {
+        // 复用单发路径的空链接告警逻辑
+        for (const SpikeData& spike_data : group) {
+            sendSpikeData(spike_data);
+        }
+        return;
+    }
+
+    // 位图窗口锚定在本组最小神经元ID上
+    uint32_t base_neuron = group.front().neuron_id;
+    for (const SpikeData& spike_data : group) {
+        base_neuron = std::min(base_neuron, spike_data.neuron_id);
+    }
+
+    SpikeBurstEvent* burst = new SpikeBurstEvent(burst_ts, base_neuron);
+    uint32_t packed_count = 0;
+    for (const SpikeData& spike_data : group) {
+        if (burst->setNeuron(spike_data.neuron_id)) {
+            packed_count++;
+        } else {
+            // 超出128神经元窗口或同神经元重复发放，退化为单脉冲事件
+            sendSpikeData(spike_data);
+        }
+    }
+
+    if (packed_count > 0) {
+        spike_output_link->send(burst);
+        events_sent_count += packed_count;
+        output->verbose(CALL_INFO, 4, 0, "发送burst: 时间%" PRIu64 ", 打包%u个脉冲\n",
+                       burst_ts, packed_count);
+    } else {
+        delete burst;
+    }
+}
+
 bool SpikeSource::loadDataset() {
     // output->verbose(CALL_INFO, 1, 0, "开始加载数据集: %s (格式: %s)\n", 
     //                dataset_path.c_str(), dataset_format.c_str());
     
     if (dataset_format == "TEXT") {
         return loadTextFormat(dataset_path);
+    } else if (dataset_format == "SOA_BIN") {
+        return loadSoaBinFormat(dataset_path);
     } else if (dataset_format == "NMNIST_AER") {
         return loadNMNISTFormat(dataset_path);
     } else if (dataset_format == "SHD_HDF5") {
@@ -242,6 +302,72 @@ bool SpikeSource::loadTextFormat(const std::string& file_path) {
     return true;
 }
 
+bool SpikeSource::loadSoaBinFormat(const std::string& file_path) {
+    // SoA二进制布局：uint32 N + uint32 nid[N] + uint64 ts_us[N]，按时间戳升序
+    // mmap整个文件后原地取数组，无逐行解析、无缓冲读拷贝；
+    // 16个源映射同一共享文件时内核只保留一份页缓存
+    // 多个源可共享一个文件，dataset_offset给出本源记录的起始字节偏移
+    int fd = open(file_path.c_str(), O_RDONLY);
+    if (fd < 0) {
+        output->verbose(CALL_INFO, 1, 0, "无法打开文件: %s\n", file_path.c_str());
+        return false;
+    }
+
+    struct stat st;
+    if (fstat(fd, &st) != 0 ||
+        static_cast<uint64_t>(st.st_size) < dataset_offset + sizeof(uint32_t)) {
+        output->verbose(CALL_INFO, 1, 0, "SOA_BIN文件头读取失败: %s\n", file_path.c_str());
+        close(fd);
+        return false;
+    }
+
+    size_t map_size = static_cast<size_t>(st.st_size);
+    void* map = mmap(nullptr, map_size, PROT_READ, MAP_SHARED, fd, 0);
+    close(fd);
+    if (map == MAP_FAILED) {
+        output->verbose(CALL_INFO, 1, 0, "SOA_BIN文件mmap失败: %s\n", file_path.c_str());
+        return false;
+    }
+
+    const uint8_t* record = static_cast<const uint8_t*>(map) + dataset_offset;
+    uint32_t total_count = 0;
+    std::memcpy(&total_count, record, sizeof(total_count));
+
+    // 校验记录边界，防止越过映射末尾
+    uint64_t record_bytes = sizeof(uint32_t)
+        + static_cast<uint64_t>(total_count) * (sizeof(uint32_t) + sizeof(uint64_t));
+    if (dataset_offset + record_bytes > static_cast<uint64_t>(st.st_size)) {
+        output->verbose(CALL_INFO, 1, 0, "SOA_BIN记录越界: %s (offset=%" PRIu64 ", N=%u)\n",
+                        file_path.c_str(), dataset_offset, total_count);
+        munmap(map, map_size);
+        return false;
+    }
+
+    uint32_t events_count = total_count;
+    if (max_events > 0 && max_events < events_count) {
+        events_count = max_events;
+    }
+
+    // 时间戳数组紧跟在完整的神经元ID数组之后（即使max_events截断也按total_count定位）；
+    // 记录偏移不保证8字节对齐，整块memcpy后再入队
+    const uint8_t* nid_bytes = record + sizeof(uint32_t);
+    const uint8_t* ts_bytes = nid_bytes + static_cast<size_t>(total_count) * sizeof(uint32_t);
+
+    std::vector<uint32_t> neuron_ids(events_count);
+    std::vector<uint64_t> timestamps(events_count);
+    std::memcpy(neuron_ids.data(), nid_bytes, static_cast<size_t>(events_count) * sizeof(uint32_t));
+    std::memcpy(timestamps.data(), ts_bytes, static_cast<size_t>(events_count) * sizeof(uint64_t));
+    munmap(map, map_size);
+
+    for (uint32_t i = 0; i < events_count; ++i) {
+        spike_queue.push(SpikeData(neuron_ids[i], timestamps[i]));
+        events_loaded_count++;
+    }
+
+    // output->verbose(CALL_INFO, 1, 0, "SOA_BIN格式加载完成: %u个事件\n", events_count);
+    return true;
+}
+
 bool SpikeSource::loadNMNISTFormat(const std::string& file_path) {
     // N-MNIST AER格式的实现
     // 这里提供一个简化的实现框架，实际需要根据具体的二进制格式来解析
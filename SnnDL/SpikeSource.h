@@ -64,16 +64,18 @@ public:
     // 参数文档
     SST_ELI_DOCUMENT_PARAMS(
         {"dataset_path",   "数据集文件路径", ""},
-        {"dataset_format", "数据集格式 (TEXT|NMNIST_AER|SHD_HDF5)", "TEXT"},
+        {"dataset_format", "数据集格式 (TEXT|SOA_BIN|NMNIST_AER|SHD_HDF5)", "TEXT"},
+        {"dataset_offset", "SOA_BIN共享文件中本源记录的起始字节偏移", "0"},
         {"time_scale",     "时间缩放因子 (仿真时间单位到数据时间单位)", "1.0"},
         {"neuron_offset",  "神经元ID偏移量", "0"},
         {"max_events",     "最大事件数量限制 (0=无限制)", "0"},
+        {"burst_pack",     "是否把同一微秒的脉冲打包为SpikeBurstEvent (1=是,0=否)", "0"},
         {"verbose",        "日志详细级别", "0"}
     )
 
     // 端口文档
     SST_ELI_DOCUMENT_PORTS(
-        {"spike_output", "发送脉冲事件的输出端口", {"SnnDL.SpikeEvent"}}
+        {"spike_output", "发送脉冲事件的输出端口", {"SnnDL.SpikeEvent", "SnnDL.SpikeBurstEvent"}}
     )
 
     // 统计信息文档
@@ -110,7 +112,20 @@ private:
     virtual bool clockTick(SST::Cycle_t current_cycle);
 
     // ===== 私有辅助方法 =====
-    
+
+    /**
+     * @brief 发送单个脉冲事件
+     * @param spike_data 待发送的脉冲
+     */
+    void sendSpikeData(const SpikeData& spike_data);
+
+    /**
+     * @brief 将同一微秒的一组脉冲打包为SpikeBurstEvent发送
+     * @param burst_ts 该组脉冲的时间戳
+     * @param group 该组脉冲（窗口外/重复的脉冲退化为单事件）
+     */
+    void sendSpikeBurst(uint64_t burst_ts, const std::vector<SpikeData>& group);
+
     /**
      * @brief 加载数据集文件
      * @return 是否加载成功
@@ -123,7 +138,14 @@ private:
      * @return 是否加载成功
      */
     bool loadTextFormat(const std::string& file_path);
-    
+
+    /**
+     * @brief 加载SoA二进制格式数据集 (uint32 N + uint32 nid[N] + uint64 ts_us[N])
+     * @param file_path 文件路径
+     * @return 是否加载成功
+     */
+    bool loadSoaBinFormat(const std::string& file_path);
+
     /**
      * @brief 加载N-MNIST AER格式数据集
      * @param file_path 文件路径
@@ -154,13 +176,16 @@ private:
     // 配置参数
     std::string dataset_path;               ///< 数据集文件路径
     std::string dataset_format;             ///< 数据集格式
+    uint64_t dataset_offset;                ///< SOA_BIN共享文件中本源记录的字节偏移
     float time_scale;                       ///< 时间缩放因子
     uint32_t neuron_offset;                 ///< 神经元ID偏移
     uint32_t max_events;                    ///< 最大事件数限制
     uint32_t neurons_per_core;              ///< 每个核心的神经元数，用于计算目标节点ID
-    
+    bool burst_pack;                        ///< 是否把同一微秒的脉冲打包为burst事件
+
     // 脉冲数据存储
     std::priority_queue<SpikeData, std::vector<SpikeData>, std::greater<SpikeData>> spike_queue;
+    std::vector<SpikeData> burst_group;     ///< burst打包的临时分组缓冲
     uint64_t current_sim_time;              ///< 当前仿真时间（微秒）
     
     // 统计计数器
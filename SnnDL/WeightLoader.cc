@@ -148,7 +148,31 @@ void WeightLoader::issueWritesFill(float value) {
 
 bool WeightLoader::readFileAllFloats(const std::string& path, const std::string& fmt, std::vector<float>& out) {
     out.clear();
-    if (fmt == "bin") {
+    if (fmt == "int8") {
+        // int8量化格式：uint32 rows + uint32 cols + float32 scale[rows] + int8 w[rows*cols]
+        // 文件字节量约为float32的1/4，读入时按行反量化，下游内存写入路径保持不变
+        std::ifstream fin(path, std::ios::binary);
+        if (!fin.good()) return false;
+        uint32_t rows = 0, cols = 0;
+        fin.read(reinterpret_cast<char*>(&rows), sizeof(rows));
+        fin.read(reinterpret_cast<char*>(&cols), sizeof(cols));
+        if (!fin.good() || rows == 0 || cols == 0) return false;
+        std::vector<float> scales(rows);
+        fin.read(reinterpret_cast<char*>(scales.data()),
+                 static_cast<std::streamsize>(rows) * sizeof(float));
+        std::vector<int8_t> cells(static_cast<size_t>(rows) * cols);
+        fin.read(reinterpret_cast<char*>(cells.data()),
+                 static_cast<std::streamsize>(cells.size()));
+        if (!fin.good()) return false;
+        out.resize(cells.size());
+        for (size_t r = 0; r < rows; ++r) {
+            const float scale = scales[r];
+            for (size_t c = 0; c < cols; ++c) {
+                out[r * cols + c] = scale * static_cast<float>(cells[r * cols + c]);
+            }
+        }
+        return true;
+    } else if (fmt == "bin") {
         std::ifstream fin(path, std::ios::binary);
         if (!fin.good()) return false;
         fin.seekg(0, std::ios::end);
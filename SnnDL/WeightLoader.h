@@ -32,7 +32,7 @@ public:
         {"num_cores", "核心数", "1"},
         {"neurons_per_core", "每核神经元数(形成 NxN 权重矩阵)", "64"},
         {"fill_value", "当无文件可用时使用的填充值(float)", "0.5"},
-        {"weight_format", "权重文件格式: bin/csv", "bin"},
+        {"weight_format", "权重文件格式: bin/int8/csv", "bin"},
         {"per_core_files", "是否按核心分文件(1=是,0=否)", "0"},
         {"file_template", "按核心分文件时的模板, 例如 weights_core{core}.bin", ""},
         {"single_file", "单文件路径(覆盖weight_file)", ""},